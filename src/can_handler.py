@@ -1,9 +1,14 @@
 # can_handler.py
 
 import can
+import errno
+import os
+import queue
 import time
 import random
+import struct
 import threading
+from can_socket import FrameReceiver, FrameRing, FrameSender, pack_frame
 from vehicle_state import (
     VehicleState,
     CAN_LEFT_SIGNAL,
@@ -20,6 +25,85 @@ BRAKE_ID = 0x0A8          # BO_ 168 EngineAndBrake
 GEAR_ID = 0x1D2           # BO_ 466 TransmissionDataDisplay
 DOOR_ID = 0x24B
 
+# Zeroed payload used to reset the reusable message buffers
+_ZEROS = bytes(8)
+
+# Fixed payload layouts: 12-bit speed left-aligned in bytes 0-1,
+# 16-bit RPM big-endian in bytes 4-5, remaining bytes zero
+_SPEED_PACK = struct.Struct(">H6x")
+_RPM_PACK = struct.Struct(">4xH2x")
+_U16_BE = struct.Struct(">H")
+
+# Heartbeat periods (seconds) for frames whose payload has not changed
+_FAST_PERIOD = 0.01  # Speed and RPM, 100 Hz
+_SLOW_PERIOD = 0.1   # Everything else, 10 Hz
+
+# SCHED_FIFO priority for the CAN worker threads
+_RT_PRIORITY = 50
+
+# Runtime messages waiting for the logger thread; newer ones are dropped past this
+_LOG_QUEUE_SIZE = 1024
+
+
+def pack_speed(buf, speed):
+    # Encode speed (kph) into an 8-byte Speed payload, 0.103 kph per bit
+    raw_speed = int(speed / 0.103)
+    _SPEED_PACK.pack_into(buf, 0, (raw_speed & 0xFFF) << 4)
+
+
+def pack_rpm(buf, rpm):
+    # Encode engine RPM into an 8-byte AccPedal payload, 0.25 rpm per bit
+    rpm_value = int(rpm / 0.25)
+    _RPM_PACK.pack_into(buf, 0, rpm_value & 0xFFFF)
+
+
+def unpack_speed(data):
+    # Decode speed (kph) from a Speed payload
+    return ((_U16_BE.unpack_from(data, 0)[0] >> 4) & 0xFFF) * 0.103
+
+
+def unpack_rpm(data):
+    # Decode engine RPM from an AccPedal payload
+    return _U16_BE.unpack_from(data, 4)[0] * 0.25
+
+
+def _make_realtime(slot):
+    # Pin the calling thread to a CPU counted from the end of the allowed set
+    # (slot 0 = last CPU) and switch it to SCHED_FIFO. Affinity is skipped on
+    # machines with too few CPUs to spare one; both steps need Linux and the
+    # scheduler change needs CAP_SYS_NICE, so failures keep the defaults.
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) > 2:
+            os.sched_setaffinity(0, {cpus[-1 - slot]})
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_RT_PRIORITY))
+    except (AttributeError, OSError):
+        pass
+
+
+def _payload(*fields, size=8):
+    # Build a constant payload from (byte_index, value) pairs
+    data = bytearray(size)
+    for index, value in fields:
+        data[index] = value
+    return bytes(data)
+
+
+# Every background frame other than speed/RPM has only a handful of states,
+# so their payloads are built once here and the loop just indexes them
+_ENGINE_PAYLOADS = (
+    _payload(),               # Off
+    _payload((2, 1 << 4)),    # Ignition on, engine stopped
+    _payload((2, 2 << 4)),    # Running
+)
+_SIGNAL_PAYLOADS = tuple(  # Indexed by the CAN_LEFT_SIGNAL/CAN_RIGHT_SIGNAL bits
+    _payload((0, bits << 4), (1, 0x01 if bits else 0x00), size=2)
+    for bits in range(4)
+)
+_BRAKE_PAYLOADS = (_payload(), _payload((7, 0x02)))
+_GEAR_PAYLOADS = tuple(_payload((1, gear)) for gear in range(256))
+
+
 class CANHandler:
     def __init__(self, channel='vcan0', state: VehicleState = None):
         self.channel = channel
@@ -36,13 +120,64 @@ class CANHandler:
         self.ignition_id = IGNITION_ID
         self.engine_status_id = ENGINE_STATUS_ID
 
+        # Received message handlers keyed by CAN ID
+        self._rx_handlers = {
+            IGNITION_ID: self._handle_ignition,
+            ENGINE_STATUS_ID: self._handle_engine_status,
+            SPEED_ID: self._handle_speed,
+            RPM_ID: self._handle_rpm,
+            TURN_SIGNAL_ID: self._handle_turn_signal,
+            BRAKE_ID: self._handle_brake,
+            GEAR_ID: self._handle_gear,
+        }
+
         # Message monitoring
         self.last_messages = []
         self.max_messages = 10
+
+        # Preallocated payload buffers, one per message sent from the caller thread
+        self._buf_ign = bytearray(8)
+        self._buf_eng = bytearray(8)
+        self._buf_speed = bytearray(8)
+        self._buf_rpm = bytearray(8)
+        self._buf_brake = bytearray(8)
+        self._buf_gear = bytearray(8)
+        self._buf_door = bytearray(8)
+
+        # Rolling 4-bit message counter
+        self._counter = 0
+
+        # Private generator for noise traffic
+        self._rng = random.Random()
+
+        # Background TX scheduling: setters wake the loop on state changes,
+        # otherwise each frame repeats only when its heartbeat is due
+        self._state_changed = threading.Event()
+        self._frame_cache = {}  # can_id -> (payload, packed can_frame)
+        self._next_due = {}
+
+        # Next time each error source may print again
+        self._err_cooldown = {}
+
+        # Runtime messages are printed by a logger thread, off the RX/TX paths
+        self._log_q = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+        self._last_logged_brake = None
+        self.log_thread = threading.Thread(target=self._print_log_messages)
+        self.log_thread.daemon = True
+        self.log_thread.start()
         
         # Setup CAN bus
         try:
             self.bus = can.interface.Bus(channel=channel, interface='socketcan')
+            # TX bypasses python-can and writes straight to the bus's own
+            # raw SocketCAN socket, so RX still never sees our own frames
+            self._tx_sender = FrameSender(self.bus.socket)
+            self._rx_receiver = FrameReceiver(self.bus.socket)
+            # Kernel-side CAN_RAW_FILTER: only IDs we handle ever wake RX
+            self.bus.set_filters([
+                {"can_id": can_id, "can_mask": 0x7FF, "extended": False}
+                for can_id in self._rx_handlers
+            ])
             self.can_enabled = True
             print("CAN Bus initialized successfully")
         except Exception as e:
@@ -50,40 +185,90 @@ class CANHandler:
             print("Running in simulation mode")
             self.can_enabled = False
 
+        # All TX goes through one writer thread that owns the socket
+        self._tx_ring = FrameRing(1024)
+        self.tx_thread = threading.Thread(target=self._write_can_messages)
+        self.tx_thread.daemon = True
+        self.tx_thread.start()
+
         # Start background message thread
         self.bg_thread = threading.Thread(target=self._send_background_messages)
         self.bg_thread.daemon = True
         self.bg_thread.start()
 
     def send_message(self, can_id, data):
-        # Send a CAN message
+        # Queue a CAN message for the writer thread as a raw can_frame
         if self.can_enabled:
-            try:
-                message = can.Message(
-                    arbitration_id=can_id,
-                    data=data,
-                    is_extended_id=False
-                )
-                self.bus.send(message)
-            except Exception as e:
-                print(f"Error sending CAN message: {e}")
+            if not self._tx_ring.push(pack_frame(can_id, data)):
+                self._log_error("tx_full", f"CAN TX queue full, dropping message {hex(can_id)}")
+
+    def _send_packed(self, packed):
+        # Queue a batch of already packed can_frames for the writer thread
+        if self.can_enabled:
+            if self._tx_ring.push_many(packed) < len(packed):
+                self._log_error("tx_full", "CAN TX queue full, dropping messages")
+
+    def _log_error(self, key, message):
+        # Print an error at most once a second per source so failures can't flood stdout
+        now = time.monotonic()
+        if now >= self._err_cooldown.get(key, 0):
+            self._err_cooldown[key] = now + 1.0
+            self._log(message)
+
+    def _log(self, message):
+        # Hand a message to the logger thread, dropping it if the logger is backed up
+        try:
+            self._log_q.put_nowait(message)
+        except queue.Full:
+            pass
+
+    def _print_log_messages(self):
+        # Logger thread: the only place runtime messages hit stdout
+        while True:
+            print(self._log_q.get())
+
+    def _write_can_messages(self):
+        # Drain queued frames and write them in batches, one syscall each
+        while self.state.running:
+            if not self._tx_ring.wait(timeout=0.1):
+                continue
+            batch = self._tx_ring.drain()
+            while batch:
+                self._safe_send(batch)
+                batch = self._tx_ring.drain()
+
+    def _safe_send(self, batch):
+        # Write one batch; a failed batch is dropped and reported, never retried
+        try:
+            self._tx_sender.send(batch)
+        except OSError as e:
+            if e.errno in (errno.ENOBUFS, errno.EAGAIN):
+                # Transient: the interface TX queue is full
+                self._log_error("tx_busy", f"CAN TX queue busy, dropped {len(batch)} frames")
+            else:
+                self._log_error(e.errno, f"Error sending CAN messages: {e}")
     
     def set_ignition(self, state):
         # Set ignition state
-        data = [0] * 8
+        data = self._buf_ign
+        data[:] = _ZEROS
         if state:
             data[2] |= 0x80  # Set AccOn bit
         else:
             data[2] |= 0x40
 
-        # Add counter and checksum as per DBC
-        data[4] = self.get_counter() & 0x0F 
-        data[4] |= (self.calculate_checksum(data) << 4) 
+        # Add counter and checksum as per DBC (get_counter/calculate_checksum inlined)
+        counter = (self._counter + 1) & 0x0F
+        self._counter = counter
+        data[4] = counter
+        data[4] = counter | ((sum(data) & 0x0F) << 4)
         self.send_message(IGNITION_ID, data)
+        self._state_changed.set()
 
     def set_engine(self, state):
         # Set engine running state
-        data = [0] * 8
+        data = self._buf_eng
+        data[:] = _ZEROS
         if state:
             data[2] |= (2 << 4) 
         else:
@@ -93,6 +278,7 @@ class CANHandler:
         data[4] = self.get_counter() & 0x0F 
         # Send the CAN message
         self.send_message(ENGINE_STATUS_ID, data)
+        self._state_changed.set()
 
     
     def update_speed(self):
@@ -146,21 +332,12 @@ class CANHandler:
 
     def send_speed_and_rpm(self, speed, rpm):
         # Send vehicle speed and RPM over CAN 
-        speed_data = [0] * 8
-        speed_kph = int(speed / 0.103)
-        
-        # DBC defines speed as a 12-bit value, scale accordingly
-        speed_data[0] = (speed_kph & 0xFF0) >> 4
-        speed_data[1] = (speed_kph & 0x00F) << 4
-        self.send_message(self.speed_id, speed_data)
+        pack_speed(self._buf_speed, speed)
+        self.send_message(self.speed_id, self._buf_speed)
         
         # Send RPM message
-        rpm_data = [0] * 8
-        rpm_value = int(rpm / 0.25)
-
-        rpm_data[4] = (rpm_value >> 8) & 0xFF
-        rpm_data[5] = rpm_value & 0xFF
-        self.send_message(self.rpm_id, rpm_data)    
+        pack_rpm(self._buf_rpm, rpm)
+        self.send_message(self.rpm_id, self._buf_rpm)
     
     def set_speed(self, speed):
         # Set vehicle speed based on gear position
@@ -210,10 +387,12 @@ class CANHandler:
 
         # Send the gear position to the CAN bus
         self.send_gear_position(position)
+        self._state_changed.set()
 
     def send_gear_position(self, position):
         # Send the gear position via CAN
-        gear_data = [0] * 8
+        gear_data = self._buf_gear
+        gear_data[:] = _ZEROS
         if position == 0:
             gear_data[1] = 0  # Park
         elif position == 1:
@@ -231,22 +410,26 @@ class CANHandler:
     def toggle_door(self, door_flag):
         # Toggle door lock/unlock
         self.state.door_state ^= door_flag
-        door_data = [0] * 8
+        door_data = self._buf_door
+        door_data[:] = _ZEROS
         door_data[0] = self.state.door_state
         self.send_message(DOOR_ID, door_data)
 
     def set_signal(self, signal_state):
         # Set turn signal state
-        print(f"set_signal called with: {signal_state}")
+        self._log(f"set_signal called with: {signal_state}")
         self.state.signal_state = signal_state
+        self._state_changed.set()
         
     def set_brake(self, pressed):
         # Set brake status and send CAN message
         self.state.brake_active = pressed
-        brake_data = [0] * 8
+        brake_data = self._buf_brake
+        brake_data[:] = _ZEROS
         if pressed:
             brake_data[7] |= 0x02 
         self.send_message(BRAKE_ID, brake_data)
+        self._state_changed.set()
 
     def calculate_checksum(self, data):
         # Calculate CAN message checksum
@@ -254,153 +437,191 @@ class CANHandler:
 
     def get_counter(self):
         # Get message counter
-        return (int(time.time() * 100)) & 0x0F
+        self._counter = (self._counter + 1) & 0x0F
+        return self._counter
     
     # Noise messages to make it harder 
     def _send_noise_message(self):
-        noise_id = random.randint(0x100, 0x1FF)  # Random ID range
-        noise_data = [random.randint(0, 255) for _ in range(8)]  # Random 8-byte data
+        noise_id = 0x100 | self._rng.getrandbits(8)  # Random ID range
+        noise_data = self._rng.randbytes(8)  # Random 8-byte data
         self.send_message(noise_id, noise_data)
 
     def _monitor_can_messages(self):
         # Monitor incoming CAN messages"""
+        # recv() blocks until frames arrive and returns all queued ones in
+        # one recvmmsg() batch, so only idle when CAN is off
+        _make_realtime(1)
         while self.state.running:
-            if self.can_enabled:
-                try:
-                    message = self.bus.recv(timeout=0.1)
-                    if message:
-                        self._process_can_message(message)
-                        if self.state.debug_mode:
-                            self.last_messages.append(f"ID: {hex(message.arbitration_id)} "
-                                                    f"Data: {[hex(x) for x in message.data]}")
-                            if len(self.last_messages) > self.max_messages:
-                                self.last_messages.pop(0)
-                except Exception as e:
-                    print(f"Error monitoring CAN messages: {e}")
-            time.sleep(0.01)
-
-    def _process_can_message(self, message):
+            if not self.can_enabled:
+                time.sleep(0.1)
+                continue
+            try:
+                for can_id, data in self._rx_receiver.recv(timeout=0.1):
+                    self._process_can_message(can_id, data)
+                    if self.state.debug_mode:
+                        self.last_messages.append(f"ID: {hex(can_id)} "
+                                                f"Data: {data.hex(' ')}")
+                        if len(self.last_messages) > self.max_messages:
+                            self.last_messages.pop(0)
+            except Exception as e:
+                self._log_error("rx", f"Error monitoring CAN messages: {e}")
+                # poll() keeps reporting a pending socket error (interface
+                # down, socket closed), so back off instead of spinning
+                time.sleep(0.1)
+
+    def _process_can_message(self, can_id, data):
         # Process received CAN message according to DBC specifications
-        if len(message.data) < 8:
-            print(f"Invalid CAN message length: {len(message.data)}")
+        if len(data) < 8:
+            self._log(f"Invalid CAN message length: {len(data)}")
             return
 
-        if message.arbitration_id == IGNITION_ID:
-            # Extract IgnitionOff
-            ignition_off = bool(message.data[2] & 0x40)  # IgnitionOff
+        handler = self._rx_handlers.get(can_id)
+        if handler:
+            handler(data)
 
-            # Determine the new ignition state
-            new_ign_state = not ignition_off  
+    def _handle_ignition(self, data):
+        # Extract IgnitionOff
+        ignition_off = bool(data[2] & 0x40)  # IgnitionOff
 
-            # Update state if it has changed
-            if self.state.ignition_on != new_ign_state:
-                print(f"Updating ignition state to: {'ON' if new_ign_state else 'OFF'}")
-                self.state.ignition_on = new_ign_state
+        # Determine the new ignition state
+        new_ign_state = not ignition_off  
 
-        elif message.arbitration_id == ENGINE_STATUS_ID:
-            if self.state.ignition_on:
-                byte_index = 20 // 8
-                bit_offset = 20 % 8
+        # Update state if it has changed
+        if self.state.ignition_on != new_ign_state:
+            self._log(f"Updating ignition state to: {'ON' if new_ign_state else 'OFF'}")
+            self.state.ignition_on = new_ign_state
+
+    def _handle_engine_status(self, data):
+        if self.state.ignition_on:
+            # StEngRun, 2 bits at bit 20 (byte 2, bit 4)
+            self.state.engine_running = (data[2] >> 4) & 0x03 == 2
+        else:
+            self._log('Ignition is OFF')
+
+    def _handle_speed(self, data):
+        # VehicleSpeed
+        self.state.current_speed = unpack_speed(data)
+
+    def _handle_rpm(self, data):
+        # EngineSpeed
+        self.state.engine_rpm = unpack_rpm(data)
+
+    def _handle_turn_signal(self, data):
+        # Process turn signals according to DBC
+        # The left/right bits in byte 0 sit at the same positions as
+        # CAN_LEFT_SIGNAL/CAN_RIGHT_SIGNAL, so mask them across directly
+        if data[1] & 0x01:  # Signal active
+            self.state.signal_state = data[0] & (CAN_LEFT_SIGNAL | CAN_RIGHT_SIGNAL)
+        else:
+            self.state.signal_state = 0
+
+    def _handle_brake(self, data):
+        self.state.brake_active = bool(data[7] & 0x02)
+        # Only log brake transitions, not every repeated frame
+        if self.state.brake_active != self._last_logged_brake:
+            self._last_logged_brake = self.state.brake_active
+            self._log(self.state.brake_active)
+
+    def _handle_gear(self, data):
+        self.state.gear_position = (data[1] & 0x0F) - 4
+
+    def _schedule_frame(self, pending, can_id, data, period, now):
+        # Queue a background frame if its payload changed or its heartbeat expired.
+        # Heartbeats of an unchanged payload reuse the cached packed frame.
+        cached = self._frame_cache.get(can_id)
+        if cached is None or cached[0] != data:
+            cached = (bytes(data), pack_frame(can_id, data))
+            self._frame_cache[can_id] = cached
+            due = now + period
+        else:
+            due = self._next_due[can_id]
+            if now < due:
+                return False
+            # Step from the previous due time so the period doesn't stretch
+            # by however late this wakeup was
+            due += period
+            if due <= now:
+                # Fell a whole period behind, resync rather than burst
+                due = now + period
+        pending.append(cached[1])
+        self._next_due[can_id] = due
+        return True
+
+    def _send_background_messages(self):
+        # Send periodic CAN messages based on DBC specifications
+        # Buffers are local to this thread so they never race the setters
+        ignition_data = bytearray(8)
+        speed_data = bytearray(8)
+        rpm_data = bytearray(8)
 
-                st_eng_run = (message.data[byte_index] >> bit_offset) & 0x03
-                self.state.engine_running = (st_eng_run == 2)
+        _make_realtime(0)
+        next_tick = time.monotonic()
+        while self.state.running:
+            # Wake on a state change, or on the next absolute heartbeat tick
+            # so the cadence doesn't drift by the time spent in each cycle
+            self._state_changed.wait(timeout=max(0.0, next_tick - time.monotonic()))
+            self._state_changed.clear()
+            now = woke = time.monotonic()
+            if woke >= next_tick:
+                # Schedule from the tick's deadline rather than the wake time,
+                # so wakeup jitter can't push a heartbeat past the next tick
+                now = next_tick
+                next_tick += _FAST_PERIOD
+                if next_tick <= woke:
+                    # Fell a whole period behind, resync rather than burst
+                    now = woke
+                    next_tick = woke + _FAST_PERIOD
+            pending = []
+
+            ignition_data[:] = _ZEROS
+            if self.state.ignition_on:
+                ignition_data[2] = 0x80
             else:
-                print('Ignition is OFF')
-
-        elif message.arbitration_id == SPEED_ID:
-            # VehicleSpeed
-            speed_raw = ((message.data[0] << 4) | (message.data[1] >> 4)) & 0xFFF
-            self.state.current_speed = speed_raw * 0.103
-
-        elif message.arbitration_id == RPM_ID:
-            # EngineSpeed
-            rpm_raw = (message.data[4] << 8) | message.data[5]
-            self.state.engine_rpm = rpm_raw * 0.25
-
-        elif message.arbitration_id == TURN_SIGNAL_ID:
-            # Process turn signals according to DBC
-            left_turn = bool(message.data[0] & 0x10)
-            right_turn = bool(message.data[0] & 0x20)  
-            signal_active = bool(message.data[1] & 0x01)  
-            
-            if signal_active:
-                self.state.signal_state = (CAN_LEFT_SIGNAL if left_turn else 0) | \
-                                              (CAN_RIGHT_SIGNAL if right_turn else 0)
+                ignition_data[2] = 0x40
+            # Counter and checksum only once the frame is actually going out
+            if self._schedule_frame(pending, self.ignition_id, ignition_data, _SLOW_PERIOD, now):
+                counter = (self._counter + 1) & 0x0F
+                self._counter = counter
+                ignition_data[4] = counter
+                ignition_data[4] = counter | ((sum(ignition_data) & 0x0F) << 4)
+                pending[-1] = pack_frame(self.ignition_id, ignition_data)
+
+            # Engine Status (ID: 0x464)
+            if self.state.engine_running:
+                engine_data = _ENGINE_PAYLOADS[2]
+            elif self.state.ignition_on:
+                engine_data = _ENGINE_PAYLOADS[1]
             else:
-                self.state.signal_state = 0
+                engine_data = _ENGINE_PAYLOADS[0]
+            self._schedule_frame(pending, self.engine_status_id, engine_data, _SLOW_PERIOD, now)
 
-        elif message.arbitration_id == BRAKE_ID:
-            self.state.brake_active = bool(message.data[7] & 0x02)
-            print(self.state.brake_active)
+            # Speed message (ID: 0x1A0)
+            pack_speed(speed_data, self.state.current_speed)
+            self._schedule_frame(pending, self.speed_id, speed_data, _FAST_PERIOD, now)
 
-        elif message.arbitration_id == GEAR_ID:
-            self.state.gear_position = (message.data[1] & 0x0F) - 4
+            # RPM message (ID: 0x0AA)
+            pack_rpm(rpm_data, self.state.engine_rpm)
+            self._schedule_frame(pending, self.rpm_id, rpm_data, _FAST_PERIOD, now)
 
-    def _send_background_messages(self):
-        # Send periodic CAN messages based on DBC specifications
-        while self.state.running:
-            try:
-                ignition_data = [0] * 8   
-                if self.state.ignition_on:
-                    ignition_data[2] = 0x80
-                else:
-                    ignition_data[2] = 0x40
-                ignition_data[4] = self.get_counter() & 0x0F
-                ignition_data[4] |= (self.calculate_checksum(ignition_data) << 4)
-                self.send_message(self.ignition_id, ignition_data)
-
-                # Engine Status (ID: 0x464)
-                engine_data = [0] * 8
-                if self.state.engine_running:
-                    engine_data[2] |= (2 << 4)
-                elif self.state.ignition_on:
-                    engine_data[2] |= (1 << 4) 
-                else:
-                    engine_data[2] &= ~(3 << 4) 
-                self.send_message(self.engine_status_id, engine_data)
-
-                # Speed message (ID: 0x1A0)
-                speed_data = [0] * 8
-                raw_speed = int(self.state.current_speed / 0.103) 
-                speed_data[0] = (raw_speed & 0xFF0) >> 4
-                speed_data[1] = (raw_speed & 0x00F) << 4
-                self.send_message(self.speed_id, speed_data)
-
-                # RPM message (ID: 0x0AA)
-                rpm_data = [0] * 8
-                rpm_value = int(self.state.engine_rpm / 0.25)  # Scale factor from DBC
-                rpm_data[4] = (rpm_value >> 8) & 0xFF
-                rpm_data[5] = rpm_value & 0xFF
-                self.send_message(self.rpm_id, rpm_data)
-
-                # Turn signal message (ID: 0x1F6)
-                signal_data = [0] * 2
-                if self.state.signal_state & CAN_LEFT_SIGNAL:
-                    signal_data[0] |= 0x10  # LeftTurn bit
-                if self.state.signal_state & CAN_RIGHT_SIGNAL:
-                    signal_data[0] |= 0x20  # RightTurn bit
-                if self.state.signal_state != 0:
-                    signal_data[1] |= 0x01  # TurnSignalActive
-                self.send_message(self.signal_id, signal_data)
-
-                # Brake status (ID: 0x0A8)
-                brake_data = [0] * 8
-                if self.state.brake_active:
-                    brake_data[7] |= 0x02 
-                self.send_message(self.brake_id, brake_data)
-
-                # Gear status (ID:x1D2)
-                gear_data = [0] * 8
-                gear_data[1] = self.state.gear_position
-                self.send_message(self.gear_id, gear_data)
-
-                # Randomly send noise messages
-                if random.random() < 0.005:  # 10% chance to send noise
-                    self._send_noise_message()
+            # Turn signal message (ID: 0x1F6)
+            signal_data = _SIGNAL_PAYLOADS[(self.state.signal_state & (CAN_LEFT_SIGNAL | CAN_RIGHT_SIGNAL)) >> 4]
+            self._schedule_frame(pending, self.signal_id, signal_data, _SLOW_PERIOD, now)
 
-            except Exception as e:
-                print(f"Error in background messages: {e}")
-                time.sleep(1)
+            # Brake status (ID: 0x0A8)
+            brake_data = _BRAKE_PAYLOADS[bool(self.state.brake_active)]
+            self._schedule_frame(pending, self.brake_id, brake_data, _SLOW_PERIOD, now)
+
+            # Gear status (ID:x1D2)
+            gear_data = _GEAR_PAYLOADS[self.state.gear_position & 0xFF]
+            self._schedule_frame(pending, self.gear_id, gear_data, _SLOW_PERIOD, now)
+
+            # Flush whatever is due this cycle at once
+            if pending:
+                self._send_packed(pending)
+
+            # Randomly send noise messages
+            if self._rng.random() < 0.005:  # 10% chance to send noise
+                self._send_noise_message()
 
     def cleanup(self):
         # Cleanup CAN connection
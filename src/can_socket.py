@@ -0,0 +1,226 @@
+# can_socket.py
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import threading
+import time
+
+# Linux struct can_frame: 32-bit ID, DLC, 3 pad bytes, 8 data bytes
+CAN_FRAME = struct.Struct("=IB3x8s")
+
+MSG_DONTWAIT = 0x40
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_libc_call(name, argtypes):
+    # Look up a libc function, None where the platform does not provide it
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        func = getattr(libc, name)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = argtypes
+    func.restype = ctypes.c_int
+    return func
+
+
+_sendmmsg = _load_libc_call(
+    "sendmmsg",
+    [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int],
+)
+_recvmmsg = _load_libc_call(
+    "recvmmsg",
+    [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_void_p],
+)
+
+
+def pack_frame(can_id, data):
+    # Build the on-the-wire struct can_frame for a standard-ID message
+    return CAN_FRAME.pack(can_id, len(data), bytes(data))
+
+
+class FrameSender:
+    # Writes batches of packed frames to a raw SocketCAN socket.
+    # The mmsghdr/iovec arrays and the frame buffer are built once, with
+    # every iovec pinned to its own 16-byte slot, so a flush is a single
+    # memmove plus one sendmmsg() call. Falls back to one send() per frame
+    # where the libc does not provide sendmmsg (non-Linux).
+    def __init__(self, sock, capacity=32):
+        self._sock = sock
+        self._capacity = capacity
+        self._buf = ctypes.create_string_buffer(CAN_FRAME.size * capacity)
+        self._iovs = (_IOVec * capacity)()
+        self._msgs = (_MMsgHdr * capacity)()
+        base = ctypes.addressof(self._buf)
+        for i in range(capacity):
+            self._iovs[i].iov_base = base + i * CAN_FRAME.size
+            self._iovs[i].iov_len = CAN_FRAME.size
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+        self._msgs_addr = ctypes.addressof(self._msgs)
+
+    def send(self, packed):
+        # Write packed frames, one sendmmsg() per capacity-sized chunk
+        if _sendmmsg is None:
+            for frame in packed:
+                self._sock.send(frame)
+            return
+
+        for start in range(0, len(packed), self._capacity):
+            chunk = packed[start:start + self._capacity]
+            count = len(chunk)
+            ctypes.memmove(self._buf, b"".join(chunk), CAN_FRAME.size * count)
+
+            # sendmmsg may stop short when the TX queue fills, so resubmit the rest
+            fd = self._sock.fileno()
+            done = 0
+            while done < count:
+                sent = _sendmmsg(fd, self._msgs_addr + done * ctypes.sizeof(_MMsgHdr),
+                                 count - done, 0)
+                if sent < 0:
+                    err = ctypes.get_errno()
+                    raise OSError(err, os.strerror(err))
+                done += sent
+
+
+class FrameReceiver:
+    # Reads batches of frames from a raw SocketCAN socket.
+    # Waits with poll(), then pulls every queued frame (up to capacity) with
+    # one non-blocking recvmmsg() into a preallocated contiguous frame array.
+    # Falls back to one recv_into() per wakeup where recvmmsg is unavailable.
+    def __init__(self, sock, capacity=32):
+        self._sock = sock
+        self._capacity = capacity
+        self._buf = ctypes.create_string_buffer(CAN_FRAME.size * capacity)
+        self._iovs = (_IOVec * capacity)()
+        self._msgs = (_MMsgHdr * capacity)()
+        base = ctypes.addressof(self._buf)
+        for i in range(capacity):
+            self._iovs[i].iov_base = base + i * CAN_FRAME.size
+            self._iovs[i].iov_len = CAN_FRAME.size
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+        self._msgs_addr = ctypes.addressof(self._msgs)
+        self._poller = select.poll()
+        self._poller.register(sock.fileno(), select.POLLIN)
+
+    def recv(self, timeout=None):
+        # Return a list of (can_id, data) frames, empty if none arrived in time
+        if not self._poller.poll(None if timeout is None else int(timeout * 1000)):
+            return []
+
+        if _recvmmsg is None:
+            if self._sock.recv_into(self._buf, CAN_FRAME.size) != CAN_FRAME.size:
+                return []
+            count = 1
+        else:
+            count = _recvmmsg(self._sock.fileno(), self._msgs_addr, self._capacity,
+                              MSG_DONTWAIT, None)
+            if count < 0:
+                err = ctypes.get_errno()
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return []
+                raise OSError(err, os.strerror(err))
+
+        frames = []
+        for i in range(count):
+            can_id, dlc, data = CAN_FRAME.unpack_from(self._buf, i * CAN_FRAME.size)
+            frames.append((can_id, data[:dlc]))
+        return frames
+
+
+class FrameRing:
+    # Bounded ring of packed CAN frames feeding a single writer thread.
+    # Producers only serialise on the tail; the consumer alone moves the head.
+    # Only the first push after a drain wakes the consumer, so a burst of
+    # sends costs one wakeup and goes out as one batch.
+    def __init__(self, size=1024):
+        if size & (size - 1):
+            raise ValueError(f"Ring size must be a power of two: {size}")
+        self._slots = [None] * size
+        self._mask = size - 1
+        self._head = 0
+        self._tail = 0
+        self._tail_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._flush_scheduled = False
+
+    def push(self, frame):
+        # Queue one packed frame, returns False if the ring is full
+        with self._tail_lock:
+            tail = self._tail
+            if tail - self._head > self._mask:
+                return False
+            self._slots[tail & self._mask] = frame
+            self._tail = tail + 1
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._ready.set()
+        return True
+
+    def push_many(self, frames):
+        # Queue a batch of packed frames, returns how many fit
+        with self._tail_lock:
+            tail = self._tail
+            space = self._mask + 1 - (tail - self._head)
+            count = min(space, len(frames))
+            for i in range(count):
+                self._slots[(tail + i) & self._mask] = frames[i]
+            self._tail = tail + count
+            schedule = count and not self._flush_scheduled
+            if count:
+                self._flush_scheduled = True
+        if schedule:
+            self._ready.set()
+        return count
+
+    def wait(self, timeout=None):
+        # Block until a flush is scheduled, returns False on timeout
+        if not self._ready.wait(timeout):
+            return False
+        self._ready.clear()
+        # Give producers one scheduling cycle to finish their burst
+        time.sleep(0)
+        with self._tail_lock:
+            self._flush_scheduled = False
+        return True
+
+    def drain(self, limit=32):
+        # Pop up to limit frames; must only be called from the consumer
+        head = self._head
+        count = min(self._tail - head, limit)
+        slots = self._slots
+        mask = self._mask
+        batch = [slots[(head + i) & mask] for i in range(count)]
+        self._head = head + count
+        return batch
@@ -2,9 +2,9 @@
 
 import pygame
 import math
-import time
 import threading
 from can_handler import CANHandler
+from gauge_math import needle_endpoint
 from vehicle_state import (
     VehicleState,
     CAN_DOOR1_LOCK,
@@ -13,8 +13,26 @@ from vehicle_state import (
     CAN_DOOR4_LOCK,
     CAN_LEFT_SIGNAL,
     CAN_RIGHT_SIGNAL,
+    gear_name,
 )
 
+# Colors
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+GRAY = (128, 128, 128)
+YELLOW = (255, 255, 0)
+
+# Window events after which the whole dashboard must be repainted
+REPAINT_EVENTS = {
+    pygame.VIDEOEXPOSE,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+}
+
 class DashboardGUI:
     def __init__(self, can_channel='vcan0'):
         pygame.init()
@@ -22,17 +40,11 @@ class DashboardGUI:
         # Constants
         self.SCREEN_WIDTH = 1000
         self.SCREEN_HEIGHT = 600
+        self.FPS = 60
         
-        # Colors
-        self.BLACK = (0, 0, 0)
-        self.WHITE = (255, 255, 255)
-        self.RED = (255, 0, 0)
-        self.GREEN = (0, 255, 0)
-        self.GRAY = (128, 128, 128)
-        self.YELLOW = (255, 255, 0)
-        
-        # Initialize display
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        # Initialize display, SCALED presents through SDL's GPU renderer
+        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
+                                              pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("CAN Bus Simulator")
         
         # Initialize CAN Handler
@@ -44,91 +56,245 @@ class DashboardGUI:
         self.RPM_CENTER = (self.SCREEN_WIDTH // 4, self.SCREEN_HEIGHT // 2)
         self.GAUGE_RADIUS = 120
         self.NEEDLE_LENGTH = 100
+        self.GAUGE_START_ANGLE = math.pi * 0.75
+        self.GAUGE_END_ANGLE = math.pi * 2.25
+
+        # Unit (cos, sin) of every tick angle
+        self._rpm_tick_trig = self._tick_trig(8)
+        self._speed_tick_trig = self._tick_trig(13)
+
+        # Needle tip offsets for every integer gauge value
+        self._rpm_needle = self._needle_table(0, 8000)
+        self._speed_needle = self._needle_table(0, 255)
+
+        # Turn signal arrow outlines
+        left_x = self.SCREEN_WIDTH // 2 - 100
+        right_x = self.SCREEN_WIDTH // 2 + 100
+        signal_y = 50
+        size = 50
+        self._left_arrow_pts = ((left_x + size, signal_y - size//2), (left_x, signal_y), (left_x + size, signal_y + size//2))
+        self._right_arrow_pts = ((right_x - size, signal_y - size//2), (right_x, signal_y), (right_x - size, signal_y + size//2))
+
+        # Status indicator boxes
+        self._ignition_rect = pygame.Rect(20, 20, 120, 40)
+        self._engine_rect = pygame.Rect(20, 70, 120, 40)
+        self._brake_rect = pygame.Rect(self.SCREEN_WIDTH // 2 - 40, self.SCREEN_HEIGHT - 40, 80, 30)
+
+        # Car body outline and the door indicators on its sides
+        self._car_rect = pygame.Rect(self.SCREEN_WIDTH // 2 - 55, self.SCREEN_HEIGHT - 120, 110, 85)
+        door_width = 5
+        door_height = 25
+        door_offset = 20
+        front_y = self._car_rect.top + door_offset
+        rear_y = self._car_rect.bottom - door_offset - door_height
+        self._door1_rect = pygame.Rect(self._car_rect.left - door_width, front_y, door_width, door_height)  # Front left
+        self._door2_rect = pygame.Rect(self._car_rect.right, front_y, door_width, door_height)  # Front right
+        self._door3_rect = pygame.Rect(self._car_rect.left - door_width, rear_y, door_width, door_height)  # Rear left
+        self._door4_rect = pygame.Rect(self._car_rect.right, rear_y, door_width, door_height)  # Rear right
+
+        # Door 1-4 colors for every door_state nibble, red when locked
+        door_flags = (CAN_DOOR1_LOCK, CAN_DOOR2_LOCK, CAN_DOOR3_LOCK, CAN_DOOR4_LOCK)
+        self._door_color_table = [
+            tuple(RED if state & flag else GREEN for flag in door_flags)
+            for state in range(16)
+        ]
+
+        # Frame rate limiter
+        self.clock = pygame.time.Clock()
+
+        # Screen areas drawn last frame, the whole screen before the first one
+        self._prev_dirty = [self.screen.get_rect()]
+
+        # What the last drawn frame showed, to skip frames that would be identical
+        self._last_snap = None
+        self._last_blink_on = None
+
+        # Fonts by point size, created on first use
+        self._font_cache = {}
+
+        # Gauge faces never change, so render them once
+        self._rpm_bg = self._render_gauge_bg(self.GAUGE_RADIUS, True)
+        self._speed_bg = self._render_gauge_bg(self.GAUGE_RADIUS, False)
+
+        # Everything that never moves, blitted in one go to clear each frame
+        self._static_bg = self._render_static_bg()
+
+        # Gauge value labels keyed by displayed integer, every value pre-rendered
+        self._speed_text_cache = {}
+        self._rpm_text_cache = {}
+        for value in range(256):
+            self._cached_text(self._speed_text_cache, value, "{} KPH")
+        for value in range(9):
+            self._cached_text(self._rpm_text_cache, value, "{}k RPM")
+
+        # Gear labels keyed by gear name, including the out-of-range fallback
+        self._gear_text_cache = {}
+        for position in range(-1, 4):
+            self._cached_text(self._gear_text_cache, gear_name(position), "Gear: {}", 48)
+
+        # Rendered debug messages and the composite they were last stacked into
+        self._debug_surf_cache = {}
+        self._debug_messages = ()
+        self._debug_composite = None
+
+        # Key handlers by key code
+        self._keydown_handlers = {
+            pygame.K_i: self._on_ignition,
+            pygame.K_s: self._on_start_stop,
+            pygame.K_g: self._on_gear,
+            pygame.K_SPACE: self._on_brake_press,
+            pygame.K_UP: self._on_accel_up,
+            pygame.K_DOWN: self._on_accel_down,
+            pygame.K_LEFT: self._on_left_signal,
+            pygame.K_RIGHT: self._on_right_signal,
+            pygame.K_1: lambda: self.can_handler.toggle_door(CAN_DOOR1_LOCK),
+            pygame.K_2: lambda: self.can_handler.toggle_door(CAN_DOOR2_LOCK),
+            pygame.K_3: lambda: self.can_handler.toggle_door(CAN_DOOR3_LOCK),
+            pygame.K_4: lambda: self.can_handler.toggle_door(CAN_DOOR4_LOCK),
+            pygame.K_d: self._on_debug,
+        }
+        self._keyup_handlers = {
+            pygame.K_UP: self._on_accel_release,
+            pygame.K_DOWN: self._on_accel_release,
+            pygame.K_LEFT: self._on_signal_release,
+            pygame.K_RIGHT: self._on_signal_release,
+            pygame.K_SPACE: self._on_brake_release,
+        }
         
         # Start monitoring thread
         self.monitor_thread = threading.Thread(target=self.can_handler._monitor_can_messages)
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
     
-    def draw_gauge(self, center, radius, min_val, max_val, current_val, title, is_rpm=False):
-        # Draw a gauge
-        pygame.draw.circle(self.screen, self.WHITE, center, radius, 2)
+    def _font(self, size):
+        # Get the default font at the given size, loading it only once
+        font = self._font_cache.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._font_cache[size] = font
+        return font
+
+    def _cached_text(self, cache, key, fmt, size=36):
+        # Get the rendered label for key, rendering fmt.format(key) on a miss
+        surface = cache.get(key)
+        if surface is None:
+            surface = self._font(size).render(fmt.format(key), True, WHITE).convert_alpha()
+            cache[key] = surface
+        return surface
+
+    def _tick_trig(self, steps):
+        # (cos, sin) of the angle of each of the steps + 1 tick marks
+        start_angle = self.GAUGE_START_ANGLE
+        end_angle = self.GAUGE_END_ANGLE
+        trig = []
+        for i in range(steps + 1):
+            angle = start_angle + (end_angle - start_angle) * (i / steps)
+            trig.append((math.cos(angle), math.sin(angle)))
+        return trig
+
+    def _needle_table(self, min_val, max_val):
+        # Needle tip (dx, dy) from the gauge centre for each integer value
+        return [
+            needle_endpoint(0, 0, self.NEEDLE_LENGTH, value, min_val, max_val,
+                            self.GAUGE_START_ANGLE, self.GAUGE_END_ANGLE)
+            for value in range(min_val, max_val + 1)
+        ]
+
+    def _render_gauge_bg(self, radius, is_rpm):
+        # Render the static part of a gauge (rim, tick marks, numbers) once
+        surface = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA).convert_alpha()
+        center = (radius, radius)
+        pygame.draw.circle(surface, WHITE, center, radius, 2)
         
         # Draw markings and numbers
-        start_angle = math.pi * 0.75
-        end_angle = math.pi * 2.25
-        
         if is_rpm:
-            steps = 8  
+            tick_trig = self._rpm_tick_trig
             step_value = 1000
         else:
-            steps = 13 
+            tick_trig = self._speed_tick_trig
             step_value = 20
         
-        for i in range(steps + 1):
-            angle = start_angle + (end_angle - start_angle) * (i / steps)
+        font = self._font(24)
+        for i, (cos_a, sin_a) in enumerate(tick_trig):
             start_pos = (
-                center[0] + (radius - 15) * math.cos(angle),
-                center[1] + (radius - 15) * math.sin(angle)
+                center[0] + (radius - 15) * cos_a,
+                center[1] + (radius - 15) * sin_a
             )
             end_pos = (
-                center[0] + radius * math.cos(angle),
-                center[1] + radius * math.sin(angle)
+                center[0] + radius * cos_a,
+                center[1] + radius * sin_a
             )
-            pygame.draw.line(self.screen, self.WHITE, start_pos, end_pos, 2)
+            pygame.draw.line(surface, WHITE, start_pos, end_pos, 2)
             
             value = i * (1 if is_rpm else step_value)
-            font = pygame.font.Font(None, 24)
-            text = font.render(str(value), True, self.WHITE)
+            text = font.render(str(value), True, WHITE)
             text_pos = (
-                center[0] + (radius - 35) * math.cos(angle) - text.get_width() // 2,
-                center[1] + (radius - 35) * math.sin(angle) - text.get_height() // 2
+                center[0] + (radius - 35) * cos_a - text.get_width() // 2,
+                center[1] + (radius - 35) * sin_a - text.get_height() // 2
             )
-            self.screen.blit(text, text_pos)
+            surface.blit(text, text_pos)
+        return surface
+
+    def _render_static_bg(self):
+        # Render the background, gauge faces and titles, and car outline once
+        surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
+        surface.fill(BLACK)
+
+        font = self._font(36)
+        for center, face, title in ((self.RPM_CENTER, self._rpm_bg, "RPM"),
+                                    (self.SPEED_CENTER, self._speed_bg, "Speed")):
+            radius = face.get_width() // 2
+            surface.blit(face, (center[0] - radius, center[1] - radius))
+            title_text = font.render(title, True, WHITE)
+            title_pos = (center[0] - title_text.get_width() // 2, center[1] + radius + 10)
+            surface.blit(title_text, title_pos)
+
+        pygame.draw.rect(surface, WHITE, self._car_rect, 1)
+        return surface
+
+    def _draw_needle(self, center, tip_offset):
+        # Draw the needle from center to center + tip_offset
+        end_pos = (center[0] + tip_offset[0], center[1] + tip_offset[1])
+        pygame.draw.line(self.screen, RED, center, end_pos, 3)
+        pygame.draw.circle(self.screen, RED, center, 5)
+
+    def draw_gauge(self, center, radius, min_val, max_val, current_val, is_rpm=False):
+        # Draw a gauge's needle and value over its static face, returns the gauge area
+        dirty = pygame.Rect(center[0] - radius, center[1] - radius, 2 * radius, 2 * radius)
 
         # Draw needle
         current_val = min(max_val, max(min_val, current_val))
-        value_ratio = (current_val - min_val) / (max_val - min_val)
-        angle = start_angle + (end_angle - start_angle) * value_ratio
-        end_pos = (
-            center[0] + self.NEEDLE_LENGTH * math.cos(angle),
-            center[1] + self.NEEDLE_LENGTH * math.sin(angle)
-        )
-        pygame.draw.line(self.screen, self.RED, center, end_pos, 3)
-        pygame.draw.circle(self.screen, self.RED, center, 5)
-        
-        # Draw title and value
-        font = pygame.font.Font(None, 36)
-        title_text = font.render(title, True, self.WHITE)
-        title_pos = (center[0] - title_text.get_width() // 2, center[1] + radius + 10)
-        self.screen.blit(title_text, title_pos)
+        needle_table = self._rpm_needle if is_rpm else self._speed_needle
+        self._draw_needle(center, needle_table[int(current_val) - min_val])
         
+        # Draw value
         if is_rpm:
-            value_text = font.render(f"{int(current_val/1000)}k RPM", True, self.WHITE)
+            value_text = self._cached_text(self._rpm_text_cache, int(current_val/1000), "{}k RPM")
         else:
-            value_text = font.render(f"{int(current_val)} KPH", True, self.WHITE)
+            value_text = self._cached_text(self._speed_text_cache, int(current_val), "{} KPH")
         value_pos = (center[0] - value_text.get_width() // 2, center[1] + 40)
-        self.screen.blit(value_text, value_pos)
+        dirty.union_ip(self.screen.blit(value_text, value_pos))
+        return dirty
     
-    def draw_status_indicators(self):
+    def draw_status_indicators(self, snap):
         # Draw ignition and engine status indicators
-        ignition_rect = pygame.Rect(20, 20, 120, 40)  
-        engine_rect = pygame.Rect(20, 70, 120, 40)    
+        ignition_rect = self._ignition_rect
+        engine_rect = self._engine_rect
         
         # Ignition status
-        if self.vehicle_state.ignition_on:
-            ign_color = self.YELLOW
+        if snap.ignition_on:
+            ign_color = YELLOW
             ign_text = "IGNITION ON"
         else:
-            ign_color = self.RED
+            ign_color = RED
             ign_text = "IGNITION OFF"
         
         # Engine status
-        if self.vehicle_state.engine_running:
-            eng_color = self.GREEN
+        if snap.engine_running:
+            eng_color = GREEN
             eng_text = "ENGINE RUN"
         else:
-            eng_color = self.RED
+            eng_color = RED
             eng_text = "ENGINE OFF"
         
         # Draw indicators with rounded corners
@@ -136,274 +302,267 @@ class DashboardGUI:
         pygame.draw.rect(self.screen, eng_color, engine_rect, border_radius=10)
         
         # Add text
-        font = pygame.font.Font(None, 24)
+        font = self._font(24)
         
         # Ignition text
-        ign_surface = font.render(ign_text, True, self.BLACK)
+        ign_surface = font.render(ign_text, True, BLACK)
         ign_text_rect = ign_surface.get_rect(center=ignition_rect.center)
         self.screen.blit(ign_surface, ign_text_rect)
         
         # Engine text
-        eng_surface = font.render(eng_text, True, self.BLACK)
+        eng_surface = font.render(eng_text, True, BLACK)
         eng_text_rect = eng_surface.get_rect(center=engine_rect.center)
         self.screen.blit(eng_surface, eng_text_rect)
+        return ignition_rect.union(engine_rect)
 
-    def draw_brake_status(self):
+    def draw_brake_status(self, snap):
         # Draw brake status indicator
-        brake_rect = pygame.Rect(
-            self.SCREEN_WIDTH // 2 - 40,  # x position
-            self.SCREEN_HEIGHT - 40,      # y position
-            80,                           # width
-            30                            # height
-        )
+        brake_rect = self._brake_rect
         # Only show brake as active if ignition is on and brake is pressed
-        if self.vehicle_state.ignition_on and self.vehicle_state.brake_active:
-            color = self.RED
+        if snap.ignition_on and snap.brake_active:
+            color = RED
         else:
-            color = self.GRAY
+            color = GRAY
 
         pygame.draw.rect(self.screen, color, brake_rect)
         
         # Add text "BRAKE"
-        font = pygame.font.Font(None, 30)
-        text = font.render("BRAKE", True, self.WHITE)
+        font = self._font(30)
+        text = font.render("BRAKE", True, WHITE)
         text_rect = text.get_rect(center=brake_rect.center)
         self.screen.blit(text, text_rect)
+        return brake_rect.union(text_rect)
 
-    def draw_door_status(self):
-        # Draw the door status indicators
-        car_center_x = self.SCREEN_WIDTH // 2
-        car_rect = pygame.Rect(
-            car_center_x - 55,
-            self.SCREEN_HEIGHT - 120,
-            110, 
-            85
-        )
-        
-        # Draw car body
-        pygame.draw.rect(self.screen, self.WHITE, car_rect, 1)
-        
-        door_state = self.can_handler.state.door_state
-        
-        # Door dimensions
-        door_width = 5
-        door_height = 25
-        door_offset = 20
-        
-        # Front left door
-        color = self.RED if door_state & CAN_DOOR1_LOCK else self.GREEN
-        pygame.draw.rect(self.screen, color, 
-                        (car_rect.left - door_width, 
-                         car_rect.top + door_offset, 
-                         door_width, door_height))
+    def draw_door_status(self, snap):
+        # Draw the door status indicators around the static car body
+        car_rect = self._car_rect
+        dirty = car_rect.copy()
         
-        # Front right door
-        color = self.RED if door_state & CAN_DOOR2_LOCK else self.GREEN
-        pygame.draw.rect(self.screen, color, 
-                        (car_rect.right, 
-                         car_rect.top + door_offset, 
-                         door_width, door_height))
+        colors = self._door_color_table[snap.door_state & 0x0F]
         
-        # Rear left door
-        color = self.RED if door_state & CAN_DOOR3_LOCK else self.GREEN
-        pygame.draw.rect(self.screen, color, 
-                        (car_rect.left - door_width, 
-                         car_rect.bottom - door_offset - door_height, 
-                         door_width, door_height))
-        
-        # Rear right door
-        color = self.RED if door_state & CAN_DOOR4_LOCK else self.GREEN
-        pygame.draw.rect(self.screen, color, 
-                        (car_rect.right, 
-                         car_rect.bottom - door_offset - door_height, 
-                         door_width, door_height))
-
-    def draw_turn_signals(self):
+        dirty.union_ip(pygame.draw.rect(self.screen, colors[0], self._door1_rect))  # Front left
+        dirty.union_ip(pygame.draw.rect(self.screen, colors[1], self._door2_rect))  # Front right
+        dirty.union_ip(pygame.draw.rect(self.screen, colors[2], self._door3_rect))  # Rear left
+        dirty.union_ip(pygame.draw.rect(self.screen, colors[3], self._door4_rect))  # Rear right
+        return dirty
+
+    def draw_turn_signals(self, snap, blink_on):
         # Draw the turn signal indicators
-        self.vehicle_state.signal_state = self.can_handler.state.signal_state
-        blink_on = int(time.time() * 2) % 2 == 0
-        
-        left_x = self.SCREEN_WIDTH // 2 - 100
-        right_x = self.SCREEN_WIDTH // 2 + 100
-        signal_y = 50
         
         # Left turn signal
-        if (self.vehicle_state.signal_state & CAN_LEFT_SIGNAL) and blink_on:
-            color = self.GREEN
+        if (snap.signal_state & CAN_LEFT_SIGNAL) and blink_on:
+            color = GREEN
         else:
-            color = self.GRAY
-        self.draw_arrow(left_x, signal_y, "left", color)
+            color = GRAY
+        dirty = pygame.draw.polygon(self.screen, color, self._left_arrow_pts)
+        pygame.draw.polygon(self.screen, WHITE, self._left_arrow_pts, 1)
         
         # Right turn signal
-        if (self.vehicle_state.signal_state & CAN_RIGHT_SIGNAL) and blink_on:
-            color = self.GREEN
-        else:
-            color = self.GRAY
-        self.draw_arrow(right_x, signal_y, "right", color)
-
-    def draw_arrow(self, x, y, direction, color):
-        # Draw a turn signal arrow
-        size = 50
-        if direction == "left":
-            points = [(x + size, y - size//2), (x, y), (x + size, y + size//2)]
+        if (snap.signal_state & CAN_RIGHT_SIGNAL) and blink_on:
+            color = GREEN
         else:
-            points = [(x - size, y - size//2), (x, y), (x - size, y + size//2)]
-        pygame.draw.polygon(self.screen, color, points)
-        pygame.draw.polygon(self.screen, self.WHITE, points, 1)
+            color = GRAY
+        dirty.union_ip(pygame.draw.polygon(self.screen, color, self._right_arrow_pts))
+        pygame.draw.polygon(self.screen, WHITE, self._right_arrow_pts, 1)
+        return dirty
 
-    def draw_gear_position(self):
+    def draw_gear_position(self, snap):
         # Display the current shift lever position
-        font = pygame.font.Font(None, 48)
-        gear_name = self.vehicle_state.get_gear_name()
-        gear_text = font.render(f"Gear: {gear_name}", True, self.WHITE)
+        gear_text = self._cached_text(self._gear_text_cache, gear_name(snap.gear_position), "Gear: {}", 48)
         gear_pos = (self.SCREEN_WIDTH // 2 - gear_text.get_width() // 2, self.SCREEN_HEIGHT - 150)
-        self.screen.blit(gear_text, gear_pos)
+        return self.screen.blit(gear_text, gear_pos)
+
+    def _render_debug_composite(self, messages):
+        # Stack the messages into one surface, rendering only ones not seen before
+        font = self._font(20)
+        surfaces = {}
+        for msg in messages:
+            text = self._debug_surf_cache.get(msg)
+            if text is None:
+                text = font.render(msg, True, YELLOW).convert_alpha()
+            surfaces[msg] = text
+        # Only keep the messages still on screen
+        self._debug_surf_cache = surfaces
+        if not messages:
+            return None
 
-    def draw_debug_info(self):
-        # Draw debug information
-        if not self.vehicle_state.debug_mode:
-            return
+        width = max(text.get_width() for text in surfaces.values())
+        composite = pygame.Surface((width, 20 * len(messages)), pygame.SRCALPHA).convert_alpha()
+        for i, msg in enumerate(messages):
+            # Lines never overlap, so MAX copies each one's alpha unchanged
+            composite.blit(surfaces[msg], (0, 20 * i), special_flags=pygame.BLEND_RGBA_MAX)
+        return composite
+
+    def draw_debug_info(self, snap):
+        # Draw debug information, returns the area drawn or None
+        if not snap.debug_mode:
+            return None
+        
+        # The list is a rolling window, so compare contents to spot new messages
+        messages = tuple(self.can_handler.last_messages)
+        if messages != self._debug_messages:
+            self._debug_messages = messages
+            self._debug_composite = self._render_debug_composite(messages)
         
-        font = pygame.font.Font(None, 20)
-        y = 10
-        for msg in self.can_handler.last_messages:
-            text = font.render(msg, True, self.YELLOW)
-            self.screen.blit(text, (10, y))
-            y += 20
+        if self._debug_composite is None:
+            return None
+        return self.screen.blit(self._debug_composite, (10, 10))
+
+    def _on_ignition(self):
+        # 'i' toggles ignition, switching it off also stops the engine
+        self.vehicle_state.ignition_on = not self.vehicle_state.ignition_on
+        self.can_handler.set_ignition(self.vehicle_state.ignition_on )
+        if not self.vehicle_state.ignition_on :
+            self.vehicle_state.engine_running = False
+            self.can_handler.set_engine(False)
+            self.vehicle_state.brake_active = False  
+
+    def _on_start_stop(self):
+        # 's' starts or stops the engine
+        if self.vehicle_state.ignition_on : 
+            self.vehicle_state.engine_running = not self.vehicle_state.engine_running
+            self.can_handler.set_engine(self.vehicle_state.engine_running)
+            if self.vehicle_state.engine_running:
+                print("Engine started - Ready to drive")
+            else:
+                print("Engine stopped")
+        else:
+            print("Turn ignition on first!")
+
+    def _on_gear(self):
+        # 'g' cycles gear positions
+        gear_order = [0, 1, 2, 3]
+        current_gear = self.vehicle_state.gear_position 
+        if current_gear in gear_order:
+            next_gear = gear_order[(gear_order.index(current_gear) + 1) % len(gear_order)]
+            # Set the next gear position
+            self.vehicle_state.gear_position = next_gear
+            self.can_handler.set_gear_position(next_gear)
+            print(f"Gear changed to: {self.vehicle_state.get_gear_name()}")
+        else:
+            # Handle invalid gear state
+            print(f"Invalid gear position: {current_gear}. Resetting to Park (P).")
+            self.vehicle_state.gear_position = 0
+            self.can_handler.set_gear_position(0)         
+
+    def _on_brake_press(self):
+        # Brake control
+        if self.vehicle_state.ignition_on:  
+            self.vehicle_state.brake_active = True
+            self.can_handler.set_brake(True)
+
+    def _on_brake_release(self):
+        # Brake release
+        if self.vehicle_state.ignition_on :
+            self.vehicle_state.brake_active = False
+            self.can_handler.set_brake(False)
+
+    def _on_accel_up(self):
+        if self.vehicle_state.engine_running: 
+            self.vehicle_state.acceleration = 1
+        else:
+            print("Start engine first!")
+
+    def _on_accel_down(self):
+        if self.vehicle_state.engine_running:
+            self.vehicle_state.acceleration = -1
+        else:
+            print("Start engine first!")
+
+    def _on_accel_release(self):
+        self.vehicle_state.acceleration = 0
+
+    def _on_left_signal(self):
+        if self.vehicle_state.ignition_on:  # Only allow signals if ignition is on
+            print("Left key pressed, setting left signal")
+            self.can_handler.set_signal(CAN_LEFT_SIGNAL)
+
+    def _on_right_signal(self):
+        if self.vehicle_state.ignition_on :  # Only allow signals if ignition is on
+            print("RIGHT key pressed, setting RIGHT signal")
+            self.can_handler.set_signal(CAN_RIGHT_SIGNAL)
+
+    def _on_signal_release(self):
+        if self.vehicle_state.ignition_on :  # Only reset signals if ignition is on
+            self.can_handler.set_signal(0)
+
+    def _on_debug(self):
+        self.vehicle_state.debug_mode = not self.vehicle_state.debug_mode
 
     def handle_events(self):
-        # Handle pygame events
+        # Handle pygame events, dispatching key presses through the handler tables
+        keydown_handlers = self._keydown_handlers
+        keyup_handlers = self._keyup_handlers
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.vehicle_state.running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_i:  # 'i' for ignition
-                    self.vehicle_state.ignition_on = not self.vehicle_state.ignition_on
-                    self.can_handler.set_ignition(self.vehicle_state.ignition_on )
-                    if not self.vehicle_state.ignition_on :
-                        self.vehicle_state.engine_running = False
-                        self.can_handler.set_engine(False)
-                        self.vehicle_state.brake_active = False  
-                        
-                elif event.key == pygame.K_s:  # 's' for start/stop engine
-                    if self.vehicle_state.ignition_on : 
-                        self.vehicle_state.engine_running = not self.vehicle_state.engine_running
-                        self.can_handler.set_engine(self.engine_running)
-                        if self.vehicle_state.engine_running:
-                            print("Engine started - Ready to drive")
-                        else:
-                            print("Engine stopped")
-                    else:
-                        print("Turn ignition on first!")
-                
-                elif event.key == pygame.K_g:  # 'g' to cycle gear positions
-                    gear_order = [0, 1, 2, 3]
-                    current_gear = self.vehicle_state.gear_position 
-                    if current_gear in gear_order:
-                        next_gear = gear_order[(gear_order.index(current_gear) + 1) % len(gear_order)]
-                        # Set the next gear position
-                        self.vehicle_state.gear_position = next_gear
-                        self.can_handler.set_gear_position(next_gear)
-                        print(f"Gear changed to: {self.vehicle_state.get_gear_name()}")
-                    else:
-                        # Handle invalid gear state
-                        print(f"Invalid gear position: {current_gear}. Resetting to Park (P).")
-                        self.vehicle_state.gear_position = 0
-                        self.can_handler.set_gear_position(0)         
-
-                elif event.key == pygame.K_SPACE:  # Brake control
-                    if self.vehicle_state.ignition_on:  
-                        self.vehicle_state.brake_active = True
-                        self.can_handler.set_brake(True)
-                        
-                elif event.key == pygame.K_UP:
-                    if self.vehicle_state.engine_running: 
-                        self.vehicle_state.acceleration = 1
-                    else:
-                        print("Start engine first!")
-                        
-                elif event.key == pygame.K_DOWN:
-                    if self.vehicle_state.engine_running:
-                        self.vehicle_state.acceleration = -1
-                    else:
-                        print("Start engine first!")
-                        
-                elif event.key == pygame.K_LEFT and self.vehicle_state.ignition_on:  # Only allow signals if ignition is on
-                        print("Left key pressed, setting left signal")
-                        self.can_handler.set_signal(CAN_LEFT_SIGNAL)
-                        
-                elif event.key == pygame.K_RIGHT:
-                    if self.vehicle_state.ignition_on :  # Only allow signals if ignition is on
-                        print("RIGHT key pressed, setting RIGHT signal")
-                        self.can_handler.set_signal(CAN_RIGHT_SIGNAL)
-                        
-                elif event.key == pygame.K_1:
-                    self.can_handler.toggle_door(CAN_DOOR1_LOCK)
-                    
-                elif event.key == pygame.K_2:
-                    self.can_handler.toggle_door(CAN_DOOR2_LOCK)
-                    
-                elif event.key == pygame.K_3:
-                    self.can_handler.toggle_door(CAN_DOOR3_LOCK)
-                    
-                elif event.key == pygame.K_4:
-                    self.can_handler.toggle_door(CAN_DOOR4_LOCK)
-                    
-                elif event.key == pygame.K_d:
-                    self.vehicle_state.debug_mode = not self.vehicle_state.debug_mode
-                    
+                handler = keydown_handlers.get(event.key)
+                if handler is not None:
+                    handler()
             elif event.type == pygame.KEYUP:
-                if event.key in (pygame.K_UP, pygame.K_DOWN):
-                    self.vehicle_state.acceleration = 0
-                    
-                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
-                    if self.vehicle_state.ignition_on :  # Only reset signals if ignition is on
-                        self.can_handler.set_signal(0)
-                        
-                elif event.key == pygame.K_SPACE:  # Brake release
-                    if self.vehicle_state.ignition_on :
-                        self.vehicle_state.brake_active = False
-                        self.can_handler.set_brake(False)
+                handler = keyup_handlers.get(event.key)
+                if handler is not None:
+                    handler()
+            elif event.type in REPAINT_EVENTS:
+                # Window contents were lost or rescaled: redraw the next frame
+                # even if the state is unchanged, and update the whole screen
+                self._last_snap = None
+                self._prev_dirty = [self.screen.get_rect()]
 
     def run(self):
         """Main loop"""
+        vs = self.vehicle_state
         try:
-            while self.vehicle_state.running:
+            while vs.running:
                 self.handle_events()
+                snap = vs.snapshot()
 
-                # Use centralized state values
-                self.ignition_on = self.vehicle_state.ignition_on
-                self.engine_running = self.vehicle_state.engine_running
-                self.current_speed = self.vehicle_state.current_speed
-                self.engine_rpm = self.vehicle_state.engine_rpm
-                self.brake_active = self.vehicle_state.brake_active
-                self.gear_position = self.vehicle_state.gear_position
-                self.signal_state = self.vehicle_state.signal_state
-
-                if self.vehicle_state.engine_running:
+                # Gauges read zero while the engine is off
+                if snap.engine_running:
+                    engine_rpm = snap.engine_rpm
+                    current_speed = snap.current_speed
                     self.can_handler.update_speed()
                 else:
-                    self.current_speed = 0
-                    self.engine_rpm = 0
+                    engine_rpm = 0
+                    current_speed = 0
+                
+                # Skip drawing when nothing on screen would change: same state,
+                # no active signal changing blink phase, no new debug messages
+                blink_on = (pygame.time.get_ticks() // 500) & 1 == 0
+                blink_changed = bool(snap.signal_state) and blink_on != self._last_blink_on
+                debug_changed = (snap.debug_mode and
+                                 tuple(self.can_handler.last_messages) != self._debug_messages)
+                if snap == self._last_snap and not blink_changed and not debug_changed:
+                    self.clock.tick(self.FPS)
+                    continue
+                self._last_snap = snap
+                self._last_blink_on = blink_on
                 
-                # Clear screen
-                self.screen.fill(self.BLACK)
+                # Clear screen back to the static background
+                self.screen.blit(self._static_bg, (0, 0))
                 
-                # Draw dashboard elements
-                self.draw_status_indicators()
-                self.draw_gauge(self.RPM_CENTER, self.GAUGE_RADIUS, 0, 8000, 
-                            self.engine_rpm, "RPM", True)
-                self.draw_gauge(self.SPEED_CENTER, self.GAUGE_RADIUS, 0, 255, 
-                            self.current_speed, "Speed")
-                self.draw_door_status()
-                self.draw_turn_signals()
-                self.draw_brake_status()
-                self.draw_gear_position() 
-                self.draw_debug_info()
+                # Draw dashboard elements, collecting the areas they touch
+                dirty = [
+                    self.draw_status_indicators(snap),
+                    self.draw_gauge(self.RPM_CENTER, self.GAUGE_RADIUS, 0, 8000, 
+                                engine_rpm, True),
+                    self.draw_gauge(self.SPEED_CENTER, self.GAUGE_RADIUS, 0, 255, 
+                                current_speed),
+                    self.draw_door_status(snap),
+                    self.draw_turn_signals(snap, blink_on),
+                    self.draw_brake_status(snap),
+                    self.draw_gear_position(snap),
+                ]
+                debug_rect = self.draw_debug_info(snap)
+                if debug_rect is not None:
+                    dirty.append(debug_rect)
                 
-                # Update display
-                pygame.display.flip()
-                pygame.time.delay(10)
+                # Update only what was drawn this frame or last frame, so
+                # elements that shrank or disappeared get cleared too
+                pygame.display.update(dirty + self._prev_dirty)
+                self._prev_dirty = dirty
+                self.clock.tick(self.FPS)
         finally:
             self.vehicle_state.running = False
             self.can_handler.cleanup()
@@ -0,0 +1,11 @@
+# gauge_math.py
+
+import math
+
+
+def needle_endpoint(cx, cy, length, value, vmin, vmax, start_angle, end_angle):
+    # Tip of a needle of the given length pivoting at (cx, cy), value clamped to the gauge range
+    v = max(vmin, min(vmax, value))
+    ratio = (v - vmin) / (vmax - vmin)
+    angle = start_angle + (end_angle - start_angle) * ratio
+    return cx + length * math.cos(angle), cy + length * math.sin(angle)
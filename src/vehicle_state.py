@@ -1,5 +1,7 @@
 # vehicle_state.py
 
+from collections import namedtuple
+
 # CAN Message Flags
 CAN_DOOR1_LOCK = 0x01
 CAN_DOOR2_LOCK = 0x02
@@ -8,7 +10,41 @@ CAN_DOOR4_LOCK = 0x08
 CAN_LEFT_SIGNAL = 0x10    
 CAN_RIGHT_SIGNAL = 0x20   
 
+# Gear position -> display name
+_GEAR_NAMES = ("P", "N", "R", "D")  # Park, Neutral, Reverse, Drive
+
+# Point-in-time copy of the fields the dashboard draws from
+StateSnapshot = namedtuple("StateSnapshot", (
+    "ignition_on",
+    "engine_running",
+    "current_speed",
+    "engine_rpm",
+    "brake_active",
+    "gear_position",
+    "signal_state",
+    "door_state",
+    "debug_mode",
+))
+
+def gear_name(gear_position):
+    # Map an integer gear position to its readable name
+    return _GEAR_NAMES[gear_position] if 0 <= gear_position < 4 else "Unknown"
+
 class VehicleState:
+    __slots__ = (
+        "running",
+        "ignition_on",
+        "engine_running",
+        "current_speed",
+        "engine_rpm",
+        "acceleration",
+        "brake_active",
+        "gear_position",
+        "door_state",
+        "signal_state",
+        "debug_mode",
+    )
+
     def __init__(self):
         # Initialize all the state relevant signals
         self.running = True
@@ -25,10 +61,18 @@ class VehicleState:
 
     def get_gear_name(self):
         # Map integer gear positions back to readable names
-        shift_map = {
-            0: "P",  # Park
-            1: "N",  # Neutral
-            2: "R",  # Reverse
-            3: "D",  # Drive
-        }
-        return shift_map.get(self.gear_position, "Unknown")
+        return gear_name(self.gear_position)
+
+    def snapshot(self):
+        # Read every displayed field once, so a frame draws one consistent state
+        return StateSnapshot(
+            self.ignition_on,
+            self.engine_running,
+            self.current_speed,
+            self.engine_rpm,
+            self.brake_active,
+            self.gear_position,
+            self.signal_state,
+            self.door_state,
+            self.debug_mode,
+        )